@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark the TMIN calculation and report paths.
+
+Times the per-pipe hot paths in isolation so performance changes can be
+measured one at a time.  From repo root:
+
+  python scripts/benchmark.py
+  python scripts/benchmark.py -n 20000 --profile
+"""
+import argparse
+import cProfile
+import pstats
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import tmin  # noqa: E402
+
+INPUT = {
+    "pressure": 285,
+    "nps": 8,
+    "schedule": 40,
+    "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS",
+    "allowable_stress": 23333,
+    "current_thickness": 0.112,
+    "install_date": "01-1990",
+    "UT_date": "03-2024",
+    "Date AR/T = 1": "01-Mar-2029",
+    "CR": "5",
+    "CR description": "General",
+}
+
+
+def _cases() -> dict:
+    inst = tmin.TMIN(INPUT)
+    inst.calculate()
+    pipe = inst._pipe
+    pipe_data = inst._pipe_data
+    return {
+        "PIPE.minimum_thickness_calculator": lambda: pipe.minimum_thickness_calculator(
+            pipe_data, current_thickness=0.112
+        ),
+        "TMIN(...) + calculate()": lambda: tmin.TMIN(INPUT).calculate(),
+        "TMIN.calculate() (reused)": inst.calculate,
+        "TMIN.report() (reused)": inst.report,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark TMIN hot paths.")
+    parser.add_argument("-n", "--number", type=int, default=10000,
+                        help="calls per timing run (default: 10000)")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="timing runs; the best is reported (default: 5)")
+    parser.add_argument("--profile", action="store_true",
+                        help="also print a cProfile summary of report() calls")
+    args = parser.parse_args()
+
+    for name, fn in _cases().items():
+        best = min(timeit.repeat(fn, number=args.number, repeat=args.repeat))
+        print(f"{name:<38} {best / args.number * 1e6:9.2f} us/call")
+
+    if args.profile:
+        inst = tmin.TMIN(INPUT)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for _ in range(args.number):
+            inst.calculate()
+            inst.report()
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Tests for the PIPE calculation layer in ``tmin.core_exp``."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from tmin.core_exp import PIPE, _ELBOW_FACTOR
+
+
+def _pipe(**overrides):
+    kwargs = dict(
+        pressure=285,
+        nps=8,
+        schedule=40,
+        pressure_class=150,
+        metallurgy="Intermediate/Low CS",
+        allowable_stress=23333,
+    )
+    kwargs.update(overrides)
+    return PIPE(**kwargs)
+
+
+def _pipe_data(pipe):
+    pipe_data = pipe.get_table_info()
+    pipe_data.update(
+        pressure=pipe.pressure,
+        nps=pipe.nps,
+        schedule=pipe.schedule,
+        metallurgy=pipe.metallurgy,
+        API_table=pipe.API_table,
+        pipe_config=pipe.pipe_config,
+    )
+    return pipe_data
+
+
+# ---------------------------------------------------------------------------
+# 90LR elbows — ASME B31.3 Eq. 3d/3e/3f, checked against hand calculation
+# NPS 8: D = 8.625 in, LR centerline radius R1 = 12 in, so R1/D = 32/23.
+#   intrados I = (4*R1/D - 1) / (4*R1/D - 2) = (105/23) / (82/23)  = 105/82
+#   extrados I = (4*R1/D + 1) / (4*R1/D + 2) = (151/23) / (174/23) = 151/174
+#   t = (P*D) / (2*((S*E*W)/I + P*Y)), P = 285, S = 23333, E = W = 1, Y = 0.4
+# ---------------------------------------------------------------------------
+
+def test_elbow_bend_factors_match_hand_calculation():
+    r_over_d = 12.0 / 8.625
+    assert _ELBOW_FACTOR["90LR - Inner Elbow"](r_over_d) == pytest.approx(105 / 82)
+    assert _ELBOW_FACTOR["90LR - Outer Elbow"](r_over_d) == pytest.approx(151 / 174)
+
+
+@pytest.mark.parametrize(
+    "pipe_config, bend_factor, expected",
+    [
+        ("straight", 1.0, 0.05241875),
+        ("90LR - Inner Elbow", 105 / 82, 0.06703016),
+        ("90LR - Outer Elbow", 151 / 174, 0.04551909),
+    ],
+)
+def test_tmin_pressure_matches_hand_calculation(pipe_config, bend_factor, expected):
+    pipe = _pipe(pipe_config=pipe_config)
+    hand = (285 * 8.625) / (2 * (23333 / bend_factor + 285 * 0.4))
+    assert hand == pytest.approx(expected, abs=1e-8)
+    assert pipe.tmin_pressure(_pipe_data(pipe)) == pytest.approx(hand)
+
+
+def test_tmin_pressure_rejects_unknown_pipe_config():
+    pipe_data = _pipe_data(_pipe())
+    pipe_data["pipe_config"] = "45 - Miter"
+    with pytest.raises(ValueError, match="invalid pipe configuration"):
+        _pipe().tmin_pressure(pipe_data)
+
+
+# ---------------------------------------------------------------------------
+# Structural tmin — API 574-2009 Table 6
+# ---------------------------------------------------------------------------
+
+def test_tmin_structural_2009_reads_table_6_row():
+    pipe = _pipe(API_table="2009")
+    assert pipe.tmin_structural(_pipe_data(pipe)) == 0.11
+
+
+def test_tmin_structural_2009_follows_the_table_in_pipe_data(monkeypatch):
+    from tmin.tables.api_574_2009 import API574_2009_TABLE_6
+
+    monkeypatch.setitem(
+        API574_2009_TABLE_6,
+        8.0,
+        {"default_minimum_structural_thickness": 0.5, "minimum_alert_thickness": 0.6},
+    )
+    pipe = _pipe(API_table="2009")
+    pipe_data = _pipe_data(pipe)
+    assert pipe_data["API574_2009_TABLE_6"][8.0]["default_minimum_structural_thickness"] == 0.5
+    assert pipe.tmin_structural(pipe_data) == 0.5
+
+
+# ---------------------------------------------------------------------------
+# get_table_info
+# ---------------------------------------------------------------------------
+
+def test_table_info_is_serializable():
+    table_info = _pipe().get_table_info()
+    assert json.loads(json.dumps(table_info))["joint_type"]["joint_efficiency"] == 1.0
+    assert pickle.loads(pickle.dumps(table_info)) == table_info
+    assert copy.deepcopy(table_info) == table_info
+
+
+def test_table_info_edits_do_not_reach_the_cache():
+    pipe = _pipe()
+    table_info = pipe.get_table_info()
+    table_info["joint_type"]["joint_efficiency"] = 0.85
+    table_info["outer_diameter"] = 0.0
+    fresh = pipe.get_table_info()
+    assert fresh["joint_type"]["joint_efficiency"] == 1.0
+    assert fresh["outer_diameter"] == 8.625
+
+
+# ---------------------------------------------------------------------------
+# minimum_thickness_calculator_many
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("default_retirement_limit", [None, 0.01, 0.08, 0.2])
+@pytest.mark.parametrize("api_table", ["2024", "2009"])
+def test_calculator_many_matches_single_reading_calls(default_retirement_limit, api_table):
+    pipe = _pipe(API_table=api_table)
+    pipe_data = _pipe_data(pipe)
+    readings = [0.322, 0.112, 0.06, 0.053, 0.0]
+    expected = [
+        pipe.minimum_thickness_calculator(pipe_data, t, default_retirement_limit)
+        for t in readings
+    ]
+    assert pipe.minimum_thickness_calculator_many(
+        pipe_data, readings, default_retirement_limit
+    ) == expected
+
+
+def test_calculator_many_accepts_any_iterable():
+    pipe = _pipe()
+    pipe_data = _pipe_data(pipe)
+    results = pipe.minimum_thickness_calculator_many(pipe_data, iter((0.2, 0.1)))
+    assert [r["current_thickness"] for r in results] == [0.2, 0.1]
+    assert pipe.minimum_thickness_calculator_many(pipe_data, []) == []
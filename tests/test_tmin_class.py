@@ -0,0 +1,28 @@
+"""Tests for the user-facing ``tmin.TMIN`` class."""
+
+import pytest
+
+import tmin
+
+INPUT = {
+    "pressure": 285,
+    "nps": 8,
+    "schedule": 40,
+    "pressure_class": 150,
+    "metallurgy": "Intermediate/Low CS",
+    "allowable_stress": 23333,
+    "current_thickness": 0.112,
+}
+
+
+@pytest.mark.parametrize("pipe_config", ["90LR - Inner Elbow", "90LR - Outer Elbow"])
+def test_elbow_configs_are_rejected(pipe_config):
+    # The memo prints the straight-pipe Eq. 3a working, so an elbow tmin
+    # would not match the equation shown.
+    with pytest.raises(ValueError, match="pipe_config"):
+        tmin.TMIN({**INPUT, "pipe_config": pipe_config})
+
+
+def test_straight_pipe_config_is_accepted():
+    result = tmin.TMIN({**INPUT, "pipe_config": "straight"}).calculate()
+    assert result["tmin_pressure"] == 0.053
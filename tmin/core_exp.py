@@ -1,20 +1,35 @@
 import math
 from dataclasses import dataclass
-from typing import Literal, Optional, Dict, Any
+from functools import cached_property
+from typing import Literal, Optional, Dict, Any, Iterable, List, Tuple
 from datetime import datetime
 
 from .tables.od_table import trueOD
-from .tables.wsrf import WSRF
-from .tables.y_coeff import (
-    ferritic_steels_y, austenitic_steels_y, other_metals_y,
-    nickel_alloy_N06690_y, nickel_alloys_N06617_N08800_N08810_N08825_y,
-    cast_iron_y,
-)
+from .tables.id_table import trueID_10, trueID_40, trueID_80, trueID_120, trueID_160
+from .tables.y_coeff import ferritic_steels_y, austenitic_steels_y
 from .tables.api_574_2024 import API574_NPS_STRUCTURAL_MIN
 from .tables.api_574_2009 import API574_2009_TABLE_6
 from .tables.ANSI_radii import ANSI_radii
 
 
+_ID_BY_SCHEDULE = {
+    10: trueID_10, 40: trueID_40, 80: trueID_80,
+    120: trueID_120, 160: trueID_160,
+}
+
+# B31.3 Table 304.1.1 Y coefficients by metallurgy; anything else uses Y = 0.4.
+_Y_BY_METALLURGY = {
+    "CS A106 GR B": ferritic_steels_y,
+    "Intermediate/Low CS": ferritic_steels_y,
+    "SS 316/316S": austenitic_steels_y,
+    "SS 316/316L": austenitic_steels_y,
+    "SS 304/304L": austenitic_steels_y,
+}
+_DEFAULT_Y = 0.4
+# Open-ended design_temp labels mapped onto the Y-table temperature keys.
+_ROUND_TEMP = {"<900": 900, "1250+": 1250}
+
+
 def _round_up(value: float, decimals: int = 3) -> float:
     """Round up (ceiling) to the specified number of decimal places.
 
@@ -26,7 +41,41 @@ def _round_up(value: float, decimals: int = 3) -> float:
     return math.ceil(shifted) / factor
 
 
-@dataclass
+# ASME B31.3 Para. 304.2.1 Eq. 3e / 3f — bend factor I as a function of R1/D,
+# applied as t = (P*D) / (2*((S*E*W)/I + P*Y)).
+_ELBOW_FACTOR = {
+    "90LR - Inner Elbow": lambda r_over_d: (4 * r_over_d - 1) / (4 * r_over_d - 2),
+    "90LR - Outer Elbow": lambda r_over_d: (4 * r_over_d + 1) / (4 * r_over_d + 2),
+}
+
+
+def _pressure_thickness(pressure: float, outer_diameter: float, sew: float,
+                        y_coefficient: float, bend_factor: float = 1.0) -> float:
+    """Unrounded pressure design thickness, ``(P*D) / (2*((S*E*W)/I + P*Y))``."""
+    return (pressure * outer_diameter) / (2 * (sew / bend_factor + pressure * y_coefficient))
+
+
+def _thickness_result(
+    current_thickness: float,
+    tmin_p: float,
+    tmin_s: Optional[float],
+    governing_thickness: float,
+    governing_type: str,
+    retirement_limit: float,
+) -> Dict[str, Any]:
+    """Result dict for one thickness reading against precomputed tmin limits."""
+    corrosion_allowance = current_thickness - retirement_limit
+    return {
+        "current_thickness": current_thickness,
+        "tmin_pressure": tmin_p,
+        "tmin_structural": tmin_s,
+        "governing_thickness": governing_thickness,
+        "governing_type": governing_type,
+        "corrosion_allowance": _round_up(corrosion_allowance) if corrosion_allowance > 0 else 0.0,
+    }
+
+
+@dataclass(frozen=True)
 class PIPE:
 
     pressure: float
@@ -43,17 +92,10 @@ class PIPE:
     API_table: Literal["2024", "2025", "2009"] = "2024"
     joint_type: Literal["seamless"] = "seamless"
 
-    trueOD = trueOD
-    WSRF = WSRF
-    ferritic_steels_y = ferritic_steels_y
-    austenitic_steels_y = austenitic_steels_y
-    other_metals_y = other_metals_y
-    nickel_alloy_N06690_y = nickel_alloy_N06690_y
-    nickel_alloys_N06617_N08800_N08810_N08825_y = nickel_alloys_N06617_N08800_N08810_N08825_y
-    cast_iron_y = cast_iron_y
-    API574_NPS_STRUCTURAL_MIN = API574_NPS_STRUCTURAL_MIN
-    API574_2009_TABLE_6 = API574_2009_TABLE_6
-    ANSI_radii = ANSI_radii
+    def __post_init__(self):
+        # Table dicts are keyed by float NPS; resolve the key once here so
+        # every lookup below is a plain dict probe (e.g. "8" or 8 -> 8.0).
+        object.__setattr__(self, "nps", float(self.nps))
 
     def get_allowable_stress(self) -> float:
         return self.allowable_stress
@@ -62,21 +104,13 @@ class PIPE:
         return trueOD[self.nps]
 
     def get_y_coefficient(self) -> float:
-        temp = self.round_temperature()
-        if self.metallurgy in ("CS A106 GR B", "Intermediate/Low CS"):
-            return self.ferritic_steels_y.get(temp, 0.4)
-        elif self.metallurgy in ("SS 316/316S", "SS 316/316L", "SS 304/304L"):
-            return self.austenitic_steels_y.get(temp, 0.4)
-        else:
-            return 0.4
+        table = _Y_BY_METALLURGY.get(self.metallurgy)
+        if table is None:
+            return _DEFAULT_Y
+        return table.get(self.round_temperature(), _DEFAULT_Y)
 
     def round_temperature(self) -> int:
-        if self.design_temp == "<900":
-            return 900
-        elif self.design_temp == "1250+":
-            return 1250
-        else:
-            return self.design_temp
+        return _ROUND_TEMP.get(self.design_temp, self.design_temp)
 
     @staticmethod
     def inches_to_mils(inches_value: float) -> float:
@@ -87,7 +121,18 @@ class PIPE:
         return mils_value * 0.001
 
     def get_table_info(self) -> Dict[str, Any]:
-        """Build enriched pipe data from table lookups for use in tmin_pressure / tmin_structural."""
+        """Build enriched pipe data from table lookups for use in tmin_pressure / tmin_structural.
+
+        Returns a new dict on each call, so callers may add keys freely.
+        """
+        table_info = dict(self._table_info)
+        # Per-pipe values get their own copy so edits cannot reach the cache.
+        table_info['joint_type'] = dict(table_info['joint_type'])
+        return table_info
+
+    @cached_property
+    def _table_info(self) -> Dict[str, Any]:
+        # PIPE is frozen, so the table lookups cannot go stale once resolved.
         return {
             'outer_diameter': self.get_outer_diameter(),
             'inner_diameter': self.get_inner_diameter(),
@@ -95,13 +140,14 @@ class PIPE:
             'joint_type': self.get_joint_type(),
             'y_coefficient': self.get_y_coefficient(),
             'centerline_radius': self.get_centerline_radius(),
-            'API574_NPS_STRUCTURAL_MIN': self.API574_NPS_STRUCTURAL_MIN,
-            'API574_2009_TABLE_6': self.API574_2009_TABLE_6,
+            'API574_NPS_STRUCTURAL_MIN': API574_NPS_STRUCTURAL_MIN,
+            'API574_2009_TABLE_6': API574_2009_TABLE_6,
         }
 
     # -------------------------------------------------------------------------
     # Pressure tmin — ASME B31.3 Para. 304.1.2 Eq. 3a
     # t = (P*D) / (2*(S*E*W + P*Y))
+    # 90° LR elbows use Para. 304.2.1 Eq. 3d with the intrados/extrados factor I.
     # -------------------------------------------------------------------------
 
     def tmin_pressure(self, pipe_data: Dict[str, Any]) -> float:
@@ -120,11 +166,14 @@ class PIPE:
         if y_coefficient is None:
             raise ValueError(f"No Y coefficient available for NPS {pipe_data['nps']}")
 
+        sew = allowable_stress * joint_efficiency * weld_strength_reduction
         if pipe_config == 'straight':
-            sew = allowable_stress * joint_efficiency * weld_strength_reduction
-            return (pressure * outer_diameter) / (2 * (sew + pressure * y_coefficient))
-        else:
+            return _pressure_thickness(pressure, outer_diameter, sew, y_coefficient)
+        elbow_factor = _ELBOW_FACTOR.get(pipe_config)
+        if elbow_factor is None:
             raise ValueError(f"Unable to calculate minimum thickness for invalid pipe configuration: {pipe_config}")
+        bend_factor = elbow_factor(pipe_data['centerline_radius'] / outer_diameter)
+        return _pressure_thickness(pressure, outer_diameter, sew, y_coefficient, bend_factor)
 
     # -------------------------------------------------------------------------
     # Structural tmin — API 574
@@ -180,6 +229,29 @@ class PIPE:
         Compute pressure and structural tmin, determine governing thickness,
         and report corrosion allowance remaining.
         """
+        limits = self._governing_limits(pipe_data, default_retirement_limit)
+        return _thickness_result(current_thickness, *limits)
+
+    def minimum_thickness_calculator_many(
+        self,
+        pipe_data: Dict[str, Any],
+        current_thicknesses: Iterable[float],
+        default_retirement_limit: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        ``minimum_thickness_calculator`` for many thickness readings on the same
+        pipe (e.g. every TML on a circuit).  Pressure / structural tmin are
+        computed once and shared; one result dict is returned per reading.
+        """
+        limits = self._governing_limits(pipe_data, default_retirement_limit)
+        return [_thickness_result(t, *limits) for t in current_thicknesses]
+
+    def _governing_limits(
+        self,
+        pipe_data: Dict[str, Any],
+        default_retirement_limit: Optional[float],
+    ) -> Tuple[float, Optional[float], float, str, float]:
+        """Return (tmin_p, tmin_s, governing_thickness, governing_type, retirement_limit)."""
         tmin_pressure_raw = self.tmin_pressure(pipe_data)
         tmin_structural_raw = self.tmin_structural(pipe_data)
 
@@ -198,29 +270,14 @@ class PIPE:
         else:
             retirement_limit = governing_thickness
 
-        corrosion_allowance = current_thickness - retirement_limit
-
-        return {
-            "current_thickness": current_thickness,
-            "tmin_pressure": tmin_p,
-            "tmin_structural": tmin_s,
-            "governing_thickness": governing_thickness,
-            "governing_type": governing_type,
-            "corrosion_allowance": _round_up(corrosion_allowance) if corrosion_allowance > 0 else 0.0,
-        }
+        return tmin_p, tmin_s, governing_thickness, governing_type, retirement_limit
 
     # -------------------------------------------------------------------------
     # Helper look-ups
     # -------------------------------------------------------------------------
 
     def get_inner_diameter(self) -> float:
-        from .tables.id_table import trueID_10, trueID_40, trueID_80, trueID_120, trueID_160
-
-        schedule_map = {
-            10: trueID_10, 40: trueID_40, 80: trueID_80,
-            120: trueID_120, 160: trueID_160,
-        }
-        table = schedule_map.get(self.schedule)
+        table = _ID_BY_SCHEDULE.get(self.schedule)
         if table is None:
             raise ValueError(f"Invalid schedule: {self.schedule}")
         return table.get(self.nps)
@@ -238,8 +295,9 @@ class PIPE:
 
     @staticmethod
     def _calculate_time_elapsed(year_inspected: int, month_inspected: Optional[int] = None) -> float:
-        current_year = datetime.now().year
-        current_month = datetime.now().month
+        now = datetime.now()
+        current_year = now.year
+        current_month = now.month
         inspection_month = month_inspected if month_inspected is not None else 1
         years_diff = current_year - year_inspected
         months_diff = current_month - inspection_month
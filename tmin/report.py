@@ -7,31 +7,36 @@ class (see ``tmin_class.py``); this module supplies helpers used internally.
 """
 
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 _PACKAGE_DIR = Path(__file__).resolve().parent
 _DEFAULT_TEMPLATE_PATH = _PACKAGE_DIR / "templates" / "engineering_memorandum.txt"
 
+# A ``[placeholder]`` in the memorandum template; group 1 is the inner name.
+_PLACEHOLDER_RE = re.compile(r"\[([^\]]+)\]")
+
 
 def get_default_template_path() -> Path:
     return _DEFAULT_TEMPLATE_PATH
 
 
 def load_template(path: Optional[Path] = None) -> str:
-    p = Path(path) if path is not None else get_default_template_path()
-    return p.read_text(encoding="utf-8")
+    if path is None:
+        return _read_default_template()
+    return Path(path).read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def _read_default_template() -> str:
+    # The bundled template ships with the package, so read it once per process.
+    return get_default_template_path().read_text(encoding="utf-8")
 
 
 def extract_placeholders(template_text: str) -> list:
-    seen: set = set()
-    order: list = []
-    for m in re.finditer(r"\[([^\]]+)\]", template_text):
-        placeholder = m.group(0)
-        if placeholder not in seen:
-            seen.add(placeholder)
-            order.append(placeholder)
-    return order
+    # Reuse the cached segment split; dict.fromkeys keeps first-seen order.
+    return list(dict.fromkeys(compile_template(template_text)[1::2]))
 
 
 def _normalize_key(key: str) -> str:
@@ -41,19 +46,36 @@ def _normalize_key(key: str) -> str:
     return k
 
 
+@lru_cache(maxsize=8)
+def compile_template(template_text: str) -> Tuple[str, ...]:
+    """Split *template_text* into literal and ``[placeholder]`` segments.
+
+    Even indices hold literal text and odd indices hold the placeholders
+    (brackets included).  Results are cached per template text, so repeated
+    fills of the same template skip the regex scan.
+    """
+    parts = _PLACEHOLDER_RE.split(template_text)
+    parts[1::2] = [f"[{name}]" for name in parts[1::2]]
+    return tuple(parts)
+
+
+@lru_cache(maxsize=1024)
+def _bracket_key(key: str) -> str:
+    # Value keys come from a small fixed vocabulary (memo field names), so the
+    # normalized ``[key]`` spelling is computed once per distinct key.
+    return f"[{_normalize_key(key)}]"
+
+
 def fill_template(template_text: str, values: Dict[str, Any]) -> str:
     """Replace each ``[placeholder]`` in *template_text* with matching values."""
     by_bracket: Dict[str, str] = {}
     for k, v in values.items():
-        norm = _normalize_key(k)
-        bracket_key = f"[{norm}]"
-        by_bracket[bracket_key] = "" if v is None else str(v).strip()
-
-    def repl(m: re.Match) -> str:
-        full = m.group(0)
-        return by_bracket.get(full, full)
+        by_bracket[_bracket_key(k)] = "" if v is None else str(v).strip()
 
-    return re.sub(r"\[[^\]]+\]", repl, template_text)
+    parts = list(compile_template(template_text))
+    for i in range(1, len(parts), 2):
+        parts[i] = by_bracket.get(parts[i], parts[i])
+    return "".join(parts)
 
 
 # ---------------------------------------------------------------------------
@@ -28,19 +28,51 @@ Usage::
 """
 
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from .core_exp import PIPE, _round_up
 from .report import fill_template, load_template
 from .tables.pmg_table import pmg_from_nps
 
+_DAYS_PER_YEAR = 365.25
+# ESL (estimated service life) comparison horizon for AR/T = 1, in years.
+_ESL_HORIZON_YEARS = 2.0
 
+# Fixed memorandum wording.
+_STRUCT_LABEL = "based on API 574-2024"
+_CR_ASSIGNMENT_BASIS = "EDD guidance and inspection confidence/effectiveness"
+
+# Memorandum fields copied verbatim from user input:
+# (template key, accepted input keys in priority order).
+_COPIED_INPUT_FIELDS = (
+    ("EDD Number", ("EDD Number", "edd_number")),
+    ("percent undamaged", ("percent undamaged", "percent_undamaged")),
+    ("percent damaged", ("percent damaged", "percent_damaged")),
+    ("Inspection Effectiveness", ("Inspection Effectiveness", "inspection_effectiveness")),
+    ("Number of RT per TML", ("Number of RT per TML", "number_of_rt_per_tml")),
+    ("coating status", ("coating status", "coating_status")),
+    ("mitigation", ("mitigation",)),
+    ("Mitigations", ("Mitigations", "mitigation")),
+)
+
+# strptime formats accepted for user-entered dates, tried in order.
+_MONTH_YEAR_FORMATS = ("%m-%Y", "%m/%Y", "%Y-%m", "%B %Y", "%b %Y")
+_ART1_DATE_FORMATS = ("%d-%b-%Y", "%d-%B-%Y", "%d-%b-%y", "%Y-%m-%d")
+
+
+def _num(v):
+    """Show whole-number floats without a trailing ``.0`` in memo text."""
+    return int(v) if v == int(v) else v
+
+
+@lru_cache(maxsize=256)
 def _parse_art_equals_1_date(value: str) -> Optional[date]:
     """Parse ``Date AR/T = 1`` values, e.g. ``01-Mar-2029``."""
     s = str(value).strip()
     if not s:
         return None
-    for fmt in ("%d-%b-%Y", "%d-%B-%Y", "%d-%b-%y", "%Y-%m-%d"):
+    for fmt in _ART1_DATE_FORMATS:
         try:
             return datetime.strptime(s, fmt).date()
         except ValueError:
@@ -52,8 +84,12 @@ def _format_ut_date_display(value: Any) -> str:
     """Pretty-print ``UT_date`` (MM-YYYY etc.) for memorandum text."""
     if value is None or value == "":
         return ""
-    s = str(value).strip()
-    for fmt in ("%m-%Y", "%m/%Y", "%Y-%m", "%B %Y", "%b %Y"):
+    return _month_year_display(str(value).strip())
+
+
+@lru_cache(maxsize=256)
+def _month_year_display(s: str) -> str:
+    for fmt in _MONTH_YEAR_FORMATS:
         try:
             d = datetime.strptime(s, fmt)
             return d.strftime("%b %Y")
@@ -62,16 +98,22 @@ def _format_ut_date_display(value: Any) -> str:
     return s
 
 
-def _esl_present_art_and_threshold(art1_str: str) -> tuple[str, str]:
-    """Return (``years until AR/T=1`` display, ``<`` or ``>`` vs 2-year ESL horizon)."""
+def _esl_present_art_and_threshold(
+    art1_str: str, today: Optional[date] = None
+) -> tuple[str, str]:
+    """Return (``years until AR/T=1`` display, ``<`` or ``>`` vs 2-year ESL horizon).
+
+    *today* defaults to ``date.today()``; pass it explicitly for reproducible output.
+    """
     art1 = _parse_art_equals_1_date(art1_str)
     if art1 is None:
         return "", ""
-    today = date.today()
-    years = (art1 - today).days / 365.25
+    if today is None:
+        today = date.today()
+    years = (art1 - today).days / _DAYS_PER_YEAR
     if years >= 0:
         present = f"{years:.1f} years"
-        thr = "<" if years <= 2.0 else ">"
+        thr = "<" if years <= _ESL_HORIZON_YEARS else ">"
     else:
         present = "past due"
         thr = "<"
@@ -84,18 +126,25 @@ def _parse_month_year(value: str) -> date:
     Accepts ``"MM-YYYY"``, ``"MM/YYYY"``, ``"YYYY-MM"``, or
     ``"Month YYYY"`` (e.g. ``"January 2020"``).
     """
-    s = str(value).strip()
-    for fmt in ("%m-%Y", "%m/%Y", "%Y-%m", "%B %Y", "%b %Y"):
-        try:
-            return datetime.strptime(s, fmt).date()
-        except ValueError:
-            continue
+    parsed = _month_year_date(str(value).strip())
+    if parsed is not None:
+        return parsed
     raise ValueError(
         f"Cannot parse date '{value}'. Use MM-YYYY, MM/YYYY, YYYY-MM, "
         f"or 'Month YYYY' (e.g. '01-1985', 'January 1985')."
     )
 
 
+@lru_cache(maxsize=256)
+def _month_year_date(s: str) -> Optional[date]:
+    for fmt in _MONTH_YEAR_FORMATS:
+        try:
+            return datetime.strptime(s, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
 class TMIN:
     """Pipe minimum thickness analysis and engineering memorandum report.
 
@@ -125,6 +174,15 @@ class TMIN:
         missing = self._REQUIRED_KEYS - set(self.inputs.keys())
         if missing:
             raise ValueError(f"Missing required inputs: {missing}")
+        # The memorandum only shows the straight-pipe Eq. 3a working; an elbow
+        # tmin (Eq. 3d with bend factor I) would not match the printed equation.
+        pipe_config = self.inputs.get("pipe_config")
+        if pipe_config is not None and pipe_config != "straight":
+            raise ValueError(
+                f"pipe_config {pipe_config!r} is not supported by TMIN: the "
+                f"memorandum only documents straight pipe (B31.3 Eq. 3a). "
+                f"Use PIPE.tmin_pressure directly for 90LR elbows."
+            )
 
     def _build_pipe(self) -> PIPE:
         kwargs: Dict[str, Any] = {
@@ -155,17 +213,24 @@ class TMIN:
         All thickness values are rounded up to the thousandths place.
         """
         pipe = self._pipe
-        pipe_data = dict(pipe.get_table_info())
-        pipe_data["pressure"] = pipe.pressure
-        pipe_data["nps"] = pipe.nps
-        pipe_data["schedule"] = pipe.schedule
-        pipe_data["pressure_class"] = pipe.pressure_class
-        pipe_data["metallurgy"] = pipe.metallurgy
-        pipe_data["API_table"] = getattr(pipe, "API_table", "2024")
-        pipe_data["pipe_config"] = getattr(pipe, "pipe_config", "straight")
-        self._pipe_data = pipe_data
+        pipe_data = self._pipe_data
+        if pipe_data is None:
+            # pipe_data depends only on the frozen PIPE built in __init__, so
+            # resolve it on the first call and reuse it afterwards.
+            pipe_data = pipe.get_table_info()
+            pipe_data["pressure"] = pipe.pressure
+            pipe_data["nps"] = pipe.nps
+            pipe_data["schedule"] = pipe.schedule
+            pipe_data["pressure_class"] = pipe.pressure_class
+            pipe_data["metallurgy"] = pipe.metallurgy
+            pipe_data["API_table"] = getattr(pipe, "API_table", "2024")
+            pipe_data["pipe_config"] = getattr(pipe, "pipe_config", "straight")
+            self._pipe_data = pipe_data
 
         current_thickness = float(self.inputs["current_thickness"])
+        od = pipe_data["outer_diameter"]
+        id_ = pipe_data["inner_diameter"]
+        nominal_wall = (od - id_) / 2
 
         result = pipe.minimum_thickness_calculator(
             pipe_data,
@@ -181,9 +246,6 @@ class TMIN:
         # PMG = pipe minimum gauge from fixed NPS table (see tables/pmg_table.py).
         # CA (total) = Nominal wall − PMG.  Consumed = Nominal − Current TML.
         # %CAC = (Nominal − Current) / (Nominal − PMG) × 100  (>100% when Current < PMG).
-        od = pipe_data["outer_diameter"]
-        id_ = pipe_data["inner_diameter"]
-        nominal_wall = (od - id_) / 2
         pmg = pmg_from_nps(pipe.nps)
         result["nominal_wall"] = round(nominal_wall, 3)
         result["pmg"] = pmg
@@ -201,18 +263,14 @@ class TMIN:
         if "install_date" in self.inputs and "UT_date" in self.inputs:
             install = _parse_month_year(self.inputs["install_date"])
             ut = _parse_month_year(self.inputs["UT_date"])
-            years_elapsed = (ut - install).days / 365.25
+            years_elapsed = (ut - install).days / _DAYS_PER_YEAR
             if years_elapsed <= 0:
                 raise ValueError(
                     f"UT_date ({ut}) must be after install_date ({install})."
                 )
-            od = pipe_data["outer_diameter"]
-            id_ = pipe_data["inner_diameter"]
-            nominal_wall = (od - id_) / 2
             wall_loss = nominal_wall - current_thickness
             cr_inches_per_year = wall_loss / years_elapsed
             cr_mpy = round(cr_inches_per_year * 1000, 1)
-            result["nominal_wall"] = round(nominal_wall, 3)
             result["wall_loss"] = round(wall_loss, 3)
             result["years_in_service"] = round(years_elapsed, 2)
             result["corrosion_rate_mpy"] = cr_mpy
@@ -231,21 +289,45 @@ class TMIN:
             self.calculate()
 
         template_text = load_template()
-        values = self._build_template_values()
+        values = self._build_template_values(datetime.now())
         return fill_template(template_text, values)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _build_template_values(self) -> Dict[str, Any]:
-        """Merge user inputs with calculated values for template filling."""
-        values: Dict[str, Any] = dict(self.inputs)
+    def _build_template_values(self, now: datetime) -> Dict[str, Any]:
+        """Merge user inputs with calculated values for template filling.
+
+        *now* is the single clock reading used for every date in the report.
+        """
+        inputs = self.inputs
+        values: Dict[str, Any] = dict(inputs)
         res = self._result
         pipe = self._pipe
         pipe_data = self._pipe_data
+        pressure = pipe.pressure
+
+        # Each result field is formatted once and reused by every section.
+        tmin_structural = res["tmin_structural"]
+        nominal_str = f"{res['nominal_wall']:.3f}"
+        current_str = f"{res['current_thickness']:.3f}"
+        tmin_p_str = f"{res['tmin_pressure']:.3f}"
+        tmin_s_str = (
+            f"{tmin_structural:.3f}" if tmin_structural is not None else "N/A"
+        )
+
+        # Modelled LTCR working, shared by the CR description and ESL paragraph.
+        mpy = res.get("corrosion_rate_mpy")
+        detail_inner = None
+        if mpy is not None:
+            detail_inner = (
+                f"({nominal_str}\" nom - "
+                f"{current_str}\" current) / "
+                f"{res['years_in_service']:.1f} yrs"
+            )
 
-        values["Date of generation"] = datetime.now().strftime("%d-%b-%Y")
+        values["Date of generation"] = now.strftime("%d-%b-%Y")
 
         # NPS display: always show as e.g. "8in" (strip any prior inch suffix first)
         if "Size" in values and values["Size"] is not None:
@@ -257,27 +339,26 @@ class TMIN:
             values["Size"] = f"{s}in"
 
         # Computed overrides for the component section
-        od = pipe.get_outer_diameter()
-        id_ = pipe.get_inner_diameter()
-        if od and id_:
-            values["Nominal Thickness"] = f"{(od - id_) / 2:.3f}"
+        values["Nominal Thickness"] = nominal_str
+
+        # Echoed in both the component section and the RBMP notes below.
+        design_temp = inputs.get("design_temp", "")
+        operating_pressure = inputs.get("operating_pressure", "")
+        operating_temperature = inputs.get("operating_temperature", "")
 
-        values["Design Pressure"] = int(pipe.pressure)
-        values["Design Temperature"] = self.inputs.get("design_temp", "")
-        values["Operating Pressure"] = self.inputs.get("operating_pressure", "")
-        values["Operating Temperature"] = self.inputs.get("operating_temperature", "")
-        values["current thickness"] = f"{res['current_thickness']:.3f}"
+        values["Design Pressure"] = int(pressure)
+        values["Design Temperature"] = design_temp
+        values["Operating Pressure"] = operating_pressure
+        values["Operating Temperature"] = operating_temperature
+        values["current thickness"] = current_str
 
         # Tmin calculation display values
         joint_info = pipe_data.get(
             "joint_type",
             {"joint_efficiency": 1.0, "weld_strength_reduction": 1.0},
         )
-        def _num(v):
-            return int(v) if v == int(v) else v
-
         # Allowable stress citation for B31.3 block (single line and/or year + code source)
-        basis = self.inputs.get("allowable_stress_basis")
+        basis = inputs.get("allowable_stress_basis")
         if isinstance(basis, str):
             basis = basis.strip()
         elif basis is not None:
@@ -285,15 +366,15 @@ class TMIN:
         else:
             basis = ""
         if not basis:
-            y = str(self.inputs.get("allowable_stress_code_year", "")).strip()
-            s = str(self.inputs.get("allowable_stress_code_source", "")).strip()
-            basis = " ".join(x for x in (y, s) if x)
+            y = str(inputs.get("allowable_stress_code_year", "")).strip()
+            s = str(inputs.get("allowable_stress_code_source", "")).strip()
+            basis = f"{y} {s}" if y and s else y or s
         if not basis:
-            legacy = self.inputs.get("Allowable Stress Basis", "")
+            legacy = inputs.get("Allowable Stress Basis", "")
             basis = str(legacy).strip() if legacy else ""
         values["allowable stress basis"] = basis
 
-        values["calc_P"] = _num(pipe_data["pressure"])
+        values["calc_P"] = _num(pressure)
         values["calc_D"] = _num(pipe_data["outer_diameter"])
         s_psi = f"{pipe_data['allowable_stress']:.0f} psi"
         values["calc_S"] = f"{s_psi} ({basis})" if basis else s_psi
@@ -301,14 +382,11 @@ class TMIN:
         values["calc_W"] = _num(joint_info["weld_strength_reduction"])
         values["calc_Y"] = _num(pipe_data["y_coefficient"])
 
-        values["tmin_pressure"] = f"{res['tmin_pressure']:.3f}"
+        values["tmin_pressure"] = tmin_p_str
 
-        values["struct_label"] = "based on API 574-2024"
+        values["struct_label"] = _STRUCT_LABEL
 
-        if res["tmin_structural"] is not None:
-            values["tmin_structural"] = f"{res['tmin_structural']:.3f}"
-        else:
-            values["tmin_structural"] = "N/A"
+        values["tmin_structural"] = tmin_s_str
 
         values["governing_thickness"] = f"{res['governing_thickness']:.3f}"
         values["governing_type"] = res["governing_type"]
@@ -317,15 +395,9 @@ class TMIN:
 
         # Modelled LTCR from install_date → UT_date: keep user "CR description" and
         # append the automated Modelled LTCR (ESL Evaluation + ESL Summary lines).
-        user_cr_description = str(self.inputs.get("CR description", "")).strip()
-        if "corrosion_rate_mpy" in res:
-            mpy = res["corrosion_rate_mpy"]
+        user_cr_description = str(inputs.get("CR description", "")).strip()
+        if detail_inner is not None:
             values["CR"] = mpy
-            detail_inner = (
-                f"({res['nominal_wall']:.3f}\" nom - "
-                f"{res['current_thickness']:.3f}\" current) / "
-                f"{res['years_in_service']:.1f} yrs"
-            )
             modelled = f"Modelled LTCR: {detail_inner}"
             if user_cr_description:
                 # User text + automated LTCR (parentheses line in ESL Evaluation)
@@ -340,30 +412,23 @@ class TMIN:
             values["CR description short"] = user_cr_description
 
         # ESL Summary (automated + user fields)
-        values["EDD"] = str(self.inputs.get("Degradation Mechanism", "")).strip()
-        art1_raw = self.inputs.get("Date AR/T = 1", "")
-        present_art, esl_thr = _esl_present_art_and_threshold(str(art1_raw))
+        values["EDD"] = str(inputs.get("Degradation Mechanism", "")).strip()
+        art1_raw = inputs.get("Date AR/T = 1", "")
+        present_art, esl_thr = _esl_present_art_and_threshold(
+            str(art1_raw), today=now.date()
+        )
         values["Present - AR/T"] = present_art
         values["ESL threshold compare"] = esl_thr
-        values["UT_date display"] = _format_ut_date_display(self.inputs.get("UT_date"))
+        values["UT_date display"] = _format_ut_date_display(inputs.get("UT_date"))
 
         def _esl_input(*keys: str) -> str:
             for k in keys:
-                if k in self.inputs and self.inputs[k] not in (None, ""):
-                    return str(self.inputs[k]).strip()
+                if k in inputs and inputs[k] not in (None, ""):
+                    return str(inputs[k]).strip()
             return ""
 
-        values["EDD Number"] = _esl_input("EDD Number", "edd_number")
-        values["percent undamaged"] = _esl_input(
-            "percent undamaged", "percent_undamaged"
-        )
-        values["percent damaged"] = _esl_input("percent damaged", "percent_damaged")
-        values["Inspection Effectiveness"] = _esl_input(
-            "Inspection Effectiveness", "inspection_effectiveness"
-        )
-        values["Number of RT per TML"] = _esl_input(
-            "Number of RT per TML", "number_of_rt_per_tml"
-        )
+        for field, keys in _COPIED_INPUT_FIELDS:
+            values[field] = _esl_input(*keys)
         # %CAC of PMG (auto) unless user overrides with percent_ca_consumed
         pc_manual = _esl_input("percent CA consumed", "percent_ca_consumed")
         if pc_manual:
@@ -372,52 +437,38 @@ class TMIN:
             values["percent CA consumed"] = f"{res['percent_cac_pmg']:.1f}%"
         else:
             values["percent CA consumed"] = ""
-        values["coating status"] = _esl_input("coating status", "coating_status")
-        values["mitigation"] = _esl_input("mitigation")
 
         # RBMP Notes (memorandum section)
-        values["design_pressure"] = int(pipe.pressure) if pipe.pressure == int(pipe.pressure) else pipe.pressure
-        values["design_temp"] = self.inputs.get("design_temp", "")
-        values["operating pressure"] = self.inputs.get("operating_pressure", "")
-        values["operating_temp"] = self.inputs.get("operating_temperature", "")
-        nps_v = float(pipe.nps)
-        values["nps"] = int(nps_v) if nps_v == int(nps_v) else nps_v
-        values["nominal wall thickness piping"] = f"{res['nominal_wall']:.3f}"
+        values["design_pressure"] = values["calc_P"]
+        values["design_temp"] = design_temp
+        values["operating pressure"] = operating_pressure
+        values["operating_temp"] = operating_temperature
+        values["nps"] = _num(pipe.nps)
+        values["nominal wall thickness piping"] = nominal_str
         pmg_rb = res.get("pmg")
         values["PMG retirement thickness"] = (
             f"{pmg_rb:.3f}" if pmg_rb is not None else "N/A"
         )
-        if res["tmin_structural"] is not None:
-            values["API 574 structural tmin"] = f"{res['tmin_structural']:.3f}"
-        else:
-            values["API 574 structural tmin"] = "N/A"
-        values["B31.3 required thickness"] = f"{res['tmin_pressure']:.3f}"
-        values["minimum measured thickness"] = f"{res['current_thickness']:.3f}"
-        values["Mitigations"] = _esl_input("Mitigations", "mitigation")
+        values["API 574 structural tmin"] = tmin_s_str
+        values["B31.3 required thickness"] = tmin_p_str
+        values["minimum measured thickness"] = current_str
         values["SHE Consequence Level"] = str(
-            self.inputs.get("SHE consequence level", "")
+            inputs.get("SHE consequence level", "")
         ).strip()
 
         # ESL Summary: conservative (manual) CR vs modelled LTCR narrative
-        cr_assigned = str(self.inputs.get("CR", "")).strip()
+        cr_assigned = str(inputs.get("CR", "")).strip()
         if not cr_assigned:
             cr_assigned = "—"
-        if "corrosion_rate_mpy" in res:
-            mpy = res["corrosion_rate_mpy"]
-            detail_inner = (
-                f"({res['nominal_wall']:.3f}\" nom - "
-                f"{res['current_thickness']:.3f}\" current) / "
-                f"{res['years_in_service']:.1f} yrs"
-            )
+        conservative = (
+            f"A conservative corrosion rate of {cr_assigned} mpy was assigned "
+            f"based on {_CR_ASSIGNMENT_BASIS}"
+        )
+        if detail_inner is not None:
             values["ESL conservative vs LTCR paragraph"] = (
-                f"A conservative corrosion rate of {cr_assigned} mpy was assigned based on "
-                "EDD guidance and inspection confidence/effectiveness; however, the modelled "
-                f"LTCR is {mpy} mpy {detail_inner}."
+                f"{conservative}; however, the modelled LTCR is {mpy} mpy {detail_inner}."
             )
         else:
-            values["ESL conservative vs LTCR paragraph"] = (
-                f"A conservative corrosion rate of {cr_assigned} mpy was assigned based on "
-                "EDD guidance and inspection confidence/effectiveness."
-            )
+            values["ESL conservative vs LTCR paragraph"] = f"{conservative}."
 
         return values